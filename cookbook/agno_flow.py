@@ -4,12 +4,13 @@ This is a blog post generator flow using the Agno framework.
 pip install agno water-ai
 """
 
-import json
+import hashlib
 from textwrap import dedent
 from typing import Dict, Optional, Any
 import asyncio
 
 from water import Flow, create_task
+from water.config import Config
 from agno.agent import Agent
 from agno.models.openai import OpenAIChat
 from agno.tools.duckduckgo import DuckDuckGoTools
@@ -43,9 +44,13 @@ class ScrapedArticle(BaseModel):
         description="Full article content in markdown format. None if content is unavailable.",
     )
 
+# Tool instances are created once and shared by the agents for the life of the process
+search_tools = DuckDuckGoTools()
+scraper_tools = Newspaper4kTools()
+
 searcher: Agent = Agent(
     model=OpenAIChat(id="gpt-4o-mini"),
-    tools=[DuckDuckGoTools()],
+    tools=[search_tools],
     description=dedent("""\
     You are BlogResearch-X, an elite research assistant specializing in discovering
     high-quality sources for compelling blog content. Your expertise includes:
@@ -76,7 +81,7 @@ searcher: Agent = Agent(
 # Content Scraper: Extracts and processes article content
 article_scraper: Agent = Agent(
     model=OpenAIChat(id="gpt-4o-mini"),
-    tools=[Newspaper4kTools()],
+    tools=[scraper_tools],
     description=dedent("""\
     You are ContentBot-X, a specialist in extracting and processing digital content
     for blog creation. Your expertise includes:
@@ -180,14 +185,23 @@ class BlogPostOutput(BaseModel):
 class ScrapedArticlesOutput(BaseModel):
     articles: Dict[str, ScrapedArticle]
 
+# --- Response Caches ---
+# Agent calls are slow and billed, so identical requests are answered from memory.
+search_cache: Dict[str, SearchResults] = {}
+scrape_cache: Dict[str, ScrapedArticle] = {}
+writer_cache: Dict[str, Dict[str, str]] = {}
+
+def prompt_key(prompt: str) -> str:
+    """Content hash used as the writer cache key."""
+    return hashlib.blake2b(prompt.encode(), digest_size=16).hexdigest()
+
 # --- Define Task Execution Functions ---
-def get_search_results(params: Dict[str, Any], context) -> SearchResults:
-    """Executes the search logic from get_search_results as a Water task."""
-    topic = params["input_data"]["topic"]
+async def search_with_retries(topic: str) -> Optional[SearchResults]:
+    """Run the searcher agent, backing off exponentially between failed attempts."""
     num_attempts: int = 3
     for attempt in range(num_attempts):
         try:
-            searcher_response: RunResponse = searcher.run(topic)
+            searcher_response: RunResponse = await searcher.arun(topic)
             if (
                 searcher_response is not None
                 and searcher_response.content is not None
@@ -204,50 +218,110 @@ def get_search_results(params: Dict[str, Any], context) -> SearchResults:
                 )
         except Exception as e:
             logger.warning(f"Attempt {attempt + 1}/{num_attempts} failed: {str(e)}")
+        if attempt < num_attempts - 1:
+            await asyncio.sleep(2 ** attempt)
 
     logger.error(f"Failed to get search results after {num_attempts} attempts")
     return None
 
-def scrape_articles(params: Dict[str, Any], context) -> ScrapedArticlesOutput:
+async def get_search_results(params: Dict[str, Any], context) -> SearchResults:
+    """Executes the search logic from get_search_results as a Water task."""
+    topic = params["input_data"]["topic"]
+    if topic in search_cache:
+        logger.info(f"Found search results in cache: {topic}")
+        return search_cache[topic]
+    try:
+        # Bound the whole retry sequence so a hung provider cannot stall the pipeline
+        results = await asyncio.wait_for(
+            search_with_retries(topic), timeout=Config.DEFAULT_TIMEOUT_SECONDS
+        )
+    except asyncio.TimeoutError:
+        logger.error(f"Search timed out after {Config.DEFAULT_TIMEOUT_SECONDS} seconds")
+        return None
+    if results is not None:
+        search_cache[topic] = results
+    return results
+
+# Cap on in-flight scraper calls so a large result set stays under the provider's rate limit
+SCRAPE_CONCURRENCY: int = 8
+SCRAPE_ATTEMPTS: int = 3
+
+async def scrape_article(url: str, semaphore: asyncio.Semaphore) -> Optional[ScrapedArticle]:
+    """Scrape a single article, retrying with exponential backoff."""
+    if url in scrape_cache:
+        logger.info(f"Found scraped article in cache: {url}")
+        return scrape_cache[url]
+    for attempt in range(SCRAPE_ATTEMPTS):
+        try:
+            # Hold a concurrency slot only for the call itself, not during backoff
+            async with semaphore:
+                article_scraper_response: RunResponse = await article_scraper.arun(url)
+            if (
+                article_scraper_response is not None
+                and article_scraper_response.content is not None
+                and isinstance(article_scraper_response.content, ScrapedArticle)
+            ):
+                scrape_cache[url] = article_scraper_response.content
+                return article_scraper_response.content
+            logger.warning(
+                f"Scrape attempt {attempt + 1}/{SCRAPE_ATTEMPTS} for {url} failed: Invalid response type"
+            )
+        except Exception as e:
+            logger.warning(f"Scrape attempt {attempt + 1}/{SCRAPE_ATTEMPTS} for {url} failed: {str(e)}")
+        if attempt < SCRAPE_ATTEMPTS - 1:
+            await asyncio.sleep(2 ** attempt)
+    return None
+
+async def scrape_articles(params: Dict[str, Any], context) -> ScrapedArticlesOutput:
     scraped_articles: Dict[str, ScrapedArticle] = {}
     search_results = params["input_data"]
+    semaphore = asyncio.Semaphore(SCRAPE_CONCURRENCY)
 
-    # Scrape the articles that are not in the cache
-    for article in search_results.articles:
-        if article.url in scraped_articles:
-            logger.info(f"Found scraped article in cache: {article.url}")
-            continue
+    # The searcher often returns the same URL more than once; scrape each only once
+    unique_urls = list(dict.fromkeys(article.url for article in search_results.articles))
 
-        article_scraper_response: RunResponse = article_scraper.run(
-            article.url
-        )
-        if (
-            article_scraper_response is not None
-            and article_scraper_response.content is not None
-            and isinstance(article_scraper_response.content, ScrapedArticle)
-        ):
-            scraped_articles[article_scraper_response.content.url] = (
-                article_scraper_response.content
-            )
-            logger.info(f"Scraped article: {article_scraper_response.content.url}")
+    # Scrape all articles concurrently; each call is independent network I/O
+    results = await asyncio.gather(
+        *(scrape_article(url, semaphore) for url in unique_urls),
+        return_exceptions=True,
+    )
+    for result in results:
+        if isinstance(result, ScrapedArticle):
+            scraped_articles[result.url] = result
+            logger.info(f"Scraped article: {result.url}")
     return scraped_articles
 
-def generate_blog_post(params: Dict[str, Any], context) -> BlogPostOutput:
+def build_writer_prompt(articles: Dict[str, ScrapedArticle]) -> str:
+    """Serialise the scraped articles into the writer prompt."""
+    # Serialise each article with pydantic-core directly instead of model_dump + json.dumps
+    return '{"articles": [' + ", ".join(
+        article.model_dump_json() for article in articles.values()
+    ) + "]}"
+
+async def generate_blog_post(params: Dict[str, Any], context) -> BlogPostOutput:
     """Generate a blog post using the Agno writer agent."""
     articles = params["input_data"]
     
     logger.info(f"✍️ Generating blog post")
-    writer_input = {
-        "articles": [article.model_dump() for article in articles.values()]
-    }
-    response = writer.run(json.dumps(writer_input, indent=2))
+    # Article bodies can be tens of KB each, so keep serialisation off the event loop
+    # run_in_executor rather than asyncio.to_thread, which needs Python 3.9
+    prompt = await asyncio.get_running_loop().run_in_executor(None, build_writer_prompt, articles)
+    key = prompt_key(prompt)
+    if key in writer_cache:
+        logger.info("Found blog post in cache.")
+        # Hand out a copy so callers that mutate the post cannot corrupt later hits
+        return dict(writer_cache[key])
+
+    response = await writer.arun(prompt)
     
     if response and response.content:
         logger.info("✅ Blog post generation complete.")
-        return {
+        blog_post = {
             "title": f"Comprehensive Guide",
             "content": response.content
         }
+        writer_cache[key] = dict(blog_post)
+        return blog_post
     else:
         logger.error("Failed to generate blog post.")
         return {
@@ -311,4 +385,9 @@ async def main():
 
 
 if __name__ == "__main__":
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
     asyncio.run(main())
\ No newline at end of file
@@ -105,4 +105,9 @@ async def main():
         print(f"ERROR - {e}")
 
 if __name__ == "__main__":
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
     asyncio.run(main()) 
\ No newline at end of file
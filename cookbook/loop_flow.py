@@ -11,7 +11,6 @@ from pydantic import BaseModel
 from typing import Dict, Any
 import asyncio
 import random
-import time
 
 # Data schemas
 class RetryState(BaseModel):
@@ -21,19 +20,21 @@ class RetryState(BaseModel):
     attempt: int = 0
     success: bool = False
     error: str = ""
-    should_retry: bool = True
+
+# Base delay for exponential backoff between retries (seconds)
+BACKOFF_BASE: float = 0.25
 
 # Retry task (simulates flaky service)
-def attempt_notification(params: Dict[str, Any], context) -> Dict[str, Any]:
+async def attempt_notification(params: Dict[str, Any], context) -> Dict[str, Any]:
     """Attempt to send notification (simulates 70% failure rate)."""
     data = params["input_data"]
     
     # Increment attempt counter
     current_attempt = data.get("attempt", 0) + 1
     
-    # Add backoff delay for retries
+    # Add exponential backoff delay for retries without blocking the event loop
     if current_attempt > 1:
-        time.sleep(0.5 * current_attempt)
+        await asyncio.sleep(BACKOFF_BASE * 2 ** (current_attempt - 1))
     
     # Simulate flaky service (60% success rate)
     success = random.random() < 0.6
@@ -44,8 +45,7 @@ def attempt_notification(params: Dict[str, Any], context) -> Dict[str, Any]:
         "max_attempts": data["max_attempts"],
         "attempt": current_attempt,
         "success": success,
-        "error": "" if success else f"Network timeout on attempt {current_attempt}",
-        "should_retry": not success and current_attempt < data["max_attempts"]
+        "error": "" if success else f"Network timeout on attempt {current_attempt}"
     }
     
     return result
@@ -63,7 +63,10 @@ notification_task = create_task(
 retry_flow = Flow(id="notification_retry", description="Notification retry flow")
 retry_flow.loop(
     task=notification_task,
-    condition=lambda result: result.get("should_retry", False)
+    condition=lambda result: (
+        not result.get("success", False)
+        and result.get("attempt", 0) < result.get("max_attempts", 3)
+    )
 ).register()
 
 async def main():
@@ -75,8 +78,7 @@ async def main():
         "max_attempts": 3,
         "attempt": 0,
         "success": False,
-        "error": "",
-        "should_retry": True
+        "error": ""
     }
     
     try:
@@ -91,4 +93,9 @@ async def main():
         print(f"Error: {e}")
 
 if __name__ == "__main__":
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
     asyncio.run(main()) 
\ No newline at end of file
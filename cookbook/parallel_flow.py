@@ -10,7 +10,7 @@ from water import Flow, create_task
 from pydantic import BaseModel
 from typing import Dict, Any
 import asyncio
-import uuid
+import itertools
 
 # Data schemas
 class UserData(BaseModel):
@@ -37,6 +37,9 @@ class Summary(BaseModel):
     total_time: float
     success: bool
 
+# Message IDs only need to be unique within this process
+_message_ids = itertools.count()
+
 # Parallel Task 1: Send Email
 def send_email(params: Dict[str, Any], context) -> Dict[str, Any]:
     """Send welcome email to the user."""
@@ -45,7 +48,7 @@ def send_email(params: Dict[str, Any], context) -> Dict[str, Any]:
     return {
         "channel": "email",
         "user_id": user["user_id"],
-        "message_id": f"email_{uuid.uuid4().hex[:8]}",
+        "message_id": f"email_{next(_message_ids):08x}",
         "sent": True,
         "delivery_time": 1.2
     }
@@ -58,7 +61,7 @@ def send_sms(params: Dict[str, Any], context) -> Dict[str, Any]:
     return {
         "channel": "sms",
         "user_id": user["user_id"],
-        "message_id": f"sms_{uuid.uuid4().hex[:8]}",
+        "message_id": f"sms_{next(_message_ids):08x}",
         "sent": True,
         "delivery_time": 0.8
     }
@@ -71,24 +74,40 @@ def send_whatsapp(params: Dict[str, Any], context) -> Dict[str, Any]:
     return {
         "channel": "whatsapp",
         "user_id": user["user_id"],
-        "message_id": f"whatsapp_{uuid.uuid4().hex[:8]}",
+        "message_id": f"whatsapp_{next(_message_ids):08x}",
         "sent": True,
         "delivery_time": 1.5
     }
 
+# Fused Task: Send all notifications in one task
+def send_all(params: Dict[str, Any], context) -> Dict[str, Any]:
+    """Send every welcome notification from a single task, keyed like the parallel results."""
+    return {
+        "email": send_email(params, context),
+        "sms": send_sms(params, context),
+        "whatsapp": send_whatsapp(params, context)
+    }
+
 # Aggregation Task: Summarize Results
 def summarize_results(params: Dict[str, Any], context) -> Dict[str, Any]:
     """Aggregate results from all parallel notification tasks."""
     results = params["input_data"]
     
-    # Count successful notifications
-    sent_count = sum(1 for result in results.values() if result["sent"])
-    
-    # Get maximum time (since they ran in parallel)
-    max_time = max(result["delivery_time"] for result in results.values())
+    # Count successful notifications and find the slowest delivery in one pass
+    # (the maximum time, since they ran in parallel)
+    user_id = None
+    sent_count = 0
+    max_time = 0.0
+    for result in results.values():
+        if user_id is None:
+            user_id = result["user_id"]
+        if result["sent"]:
+            sent_count += 1
+        if result["delivery_time"] > max_time:
+            max_time = result["delivery_time"]
     
     return {
-        "user_id": list(results.values())[0]["user_id"],
+        "user_id": user_id,
         "notifications_sent": sent_count,
         "total_time": max_time,
         "success": sent_count == 3
@@ -119,6 +138,14 @@ whatsapp_task = create_task(
     execute=send_whatsapp
 )
 
+send_all_task = create_task(
+    id="send_all",
+    description="Send all notifications",
+    input_schema=UserData,
+    output_schema=ParallelResults,
+    execute=send_all
+)
+
 summary_task = create_task(
     id="summary",
     description="Summarize notification results",
@@ -135,6 +162,11 @@ send_notification_flow.parallel([
     whatsapp_task
 ]).then(summary_task).register()
 
+# Fused variant: the handlers are cheap and in-process, so one task avoids
+# scheduling three separate task dispatches for the same result
+send_notification_fused_flow = Flow(id="send_notifications_fused", description="Fused send notification flow")
+send_notification_fused_flow.then(send_all_task).then(summary_task).register()
+
 async def main():
     """Run the send notification flow example."""
     
@@ -153,4 +185,9 @@ async def main():
         print(f"ERROR - {e}")
 
 if __name__ == "__main__":
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
     asyncio.run(main()) 
\ No newline at end of file
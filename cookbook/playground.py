@@ -1,12 +1,22 @@
+import os
+
 from water import FlowServer
 from branched_flow import notification_flow
 from loop_flow import retry_flow
-from parallel_flow import send_notification_flow
+from parallel_flow import send_notification_flow, send_notification_fused_flow
 from sequential_flow import registration_flow
 
 # Create server with flows
-app = FlowServer(flows=[notification_flow, retry_flow, send_notification_flow, registration_flow]).get_app()
+app = FlowServer(flows=[notification_flow, retry_flow, send_notification_flow, send_notification_fused_flow, registration_flow]).get_app()
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run("playground:app", host="0.0.0.0", port=8000, reload=True)
\ No newline at end of file
+    # Reload is for local development only; scale WATER_WORKERS for CPU-heavy flows.
+    # uvicorn picks uvloop and httptools automatically when they are installed.
+    uvicorn.run(
+        "playground:app",
+        host="0.0.0.0",
+        port=8000,
+        workers=int(os.getenv("WATER_WORKERS", "1")),
+        reload=os.getenv("WATER_RELOAD", "0") == "1",
+    )
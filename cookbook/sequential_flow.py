@@ -10,7 +10,7 @@ from water import Flow, create_task
 from pydantic import BaseModel
 from typing import Dict, Any
 import asyncio
-import uuid
+import secrets
 
 # Data schemas
 class UserRequest(BaseModel):
@@ -43,22 +43,35 @@ class RegistrationSummary(BaseModel):
     total_time: float
 
 # Step 1: Validate Input
+# (field, check, error message) triples evaluated in order
+VALIDATORS = (
+    ("email", lambda email: "@" in email, "Invalid email"),
+    ("password", lambda password: len(password) >= 6, "Password too short"),
+    ("first_name", bool, "Name required"),
+)
+
 def validate_input(params: Dict[str, Any], context) -> Dict[str, Any]:
     """Validate user registration data."""
     request = params["input_data"]
-    errors = []
+    email = request["email"]
+    first_name = request["first_name"]
+    
+    # Common case: everything is valid, so skip the per-rule calls. This inlines
+    # the VALIDATORS rules and must be kept in sync with them.
+    if "@" in email and len(request["password"]) >= 6 and first_name:
+        return {
+            "email": email,
+            "first_name": first_name,
+            "is_valid": True,
+            "errors": []
+        }
     
-    if "@" not in request["email"]:
-        errors.append("Invalid email")
-    if len(request["password"]) < 6:
-        errors.append("Password too short")
-    if not request["first_name"]:
-        errors.append("Name required")
+    errors = [message for field, check, message in VALIDATORS if not check(request[field])]
     
     return {
-        "email": request["email"],
-        "first_name": request["first_name"],
-        "is_valid": len(errors) == 0,
+        "email": email,
+        "first_name": first_name,
+        "is_valid": False,
         "errors": errors
     }
 
@@ -76,7 +89,7 @@ def create_account(params: Dict[str, Any], context) -> Dict[str, Any]:
         }
     
     # Generate user ID
-    user_id = f"user_{uuid.uuid4().hex[:8]}"
+    user_id = f"user_{secrets.token_hex(4)}"
     
     return {
         "email": current_data["email"],
@@ -101,7 +114,7 @@ def setup_profile(params: Dict[str, Any], context) -> Dict[str, Any]:
         }
     
     # Generate profile ID
-    profile_id = f"profile_{uuid.uuid4().hex[:8]}"
+    profile_id = f"profile_{secrets.token_hex(4)}"
     
     return {
         "user_id": current_data["user_id"],
@@ -186,4 +199,9 @@ async def main():
         print(f"ERROR - {e}")
 
 if __name__ == "__main__":
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
     asyncio.run(main()) 
\ No newline at end of file
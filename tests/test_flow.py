@@ -1,8 +1,18 @@
 import pytest
 import asyncio
+import os
+import random
+import re
+import threading
+import time
+from decimal import Decimal
+from fastapi.testclient import TestClient
 from pydantic import BaseModel
-from water import create_task
+from water import create_task, FlowServer
 from water.flow import Flow
+from water.context import ExecutionContext
+from water.execution_engine import ExecutionEngine
+from water.utils import generate_id
 
 
 # --- Test Schemas ---
@@ -25,6 +35,54 @@ def test_flow_custom_id_description():
     assert flow.id == "custom_flow"
     assert flow.description == "Custom flow with explicit description"
 
+def test_generated_ids():
+    flow = Flow()
+    task = create_task(
+        input_schema=NumberInput,
+        output_schema=NumberOutput,
+        execute=lambda params, context: params["input_data"]
+    )
+    assert re.fullmatch(r"flow_[0-9a-f]{8}", flow.id)
+    assert re.fullmatch(r"task_[0-9a-f]{8}", task.id)
+    assert flow.description == f"Flow {flow.id}"
+    assert task.description == f"Task {task.id}"
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_generated_ids_differ_after_fork():
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.write(write_fd, generate_id("exec").encode())
+        os._exit(0)
+    os.waitpid(pid, 0)
+    os.close(write_fd)
+    child_id = os.read(read_fd, 64).decode()
+    os.close(read_fd)
+    assert child_id != generate_id("exec")
+
+def test_generated_ids_do_not_consume_global_random_state():
+    random.seed(42)
+    expected = random.random()
+
+    random.seed(42)
+    Flow()
+    assert random.random() == expected
+
+def test_task_detects_async_execute():
+    async def async_execute(params, context):
+        return params["input_data"]
+
+    task = create_task(
+        input_schema=NumberInput,
+        output_schema=NumberOutput,
+        execute=lambda params, context: params["input_data"]
+    )
+    assert not task._is_coro
+
+    task.execute = async_execute
+    assert task._is_coro
+    assert task.execute is async_execute
+
 # --- Task Validation Tests ---
 
 def test_then_none_task():
@@ -37,6 +95,47 @@ def test_empty_flow_registration():
     with pytest.raises(ValueError, match="Flow must have at least one task"):
         flow.register()
 
+def test_register_freezes_graph():
+    task = create_task(
+        input_schema=NumberInput,
+        output_schema=NumberOutput,
+        execute=lambda params, context: params["input_data"]
+    )
+    flow = Flow(id="frozen_flow").parallel([task]).register()
+    assert flow._graph == tuple(flow._tasks)
+    assert isinstance(flow._graph[0].tasks, tuple)
+
+class MysteryNode:
+    type = "mystery"
+
+@pytest.mark.asyncio
+async def test_unknown_node_type():
+    with pytest.raises(ValueError, match="Unknown node type: mystery"):
+        await ExecutionEngine.run([MysteryNode()], {"value": 1}, flow_id="unknown_node_flow")
+
+class NegativeKindNode:
+    type = "negative"
+    kind = -1
+
+class StringKindNode:
+    type = "stringly"
+    kind = "loop"
+
+def test_compile_rejects_unknown_node_type():
+    with pytest.raises(ValueError, match="Unknown node type: mystery"):
+        ExecutionEngine.compile([MysteryNode()])
+    with pytest.raises(ValueError, match="Unknown node type: negative"):
+        ExecutionEngine.compile([NegativeKindNode()])
+    with pytest.raises(ValueError, match="Unknown node type: stringly"):
+        ExecutionEngine.compile([StringKindNode()])
+    with pytest.raises(ValueError, match="Unknown node type"):
+        ExecutionEngine.compile([object()])
+
+@pytest.mark.asyncio
+async def test_run_rejects_legacy_dict_nodes():
+    with pytest.raises(ValueError, match="Unknown node type"):
+        await ExecutionEngine.run([{"type": "sequential"}], {"value": 1}, flow_id="dict_node_flow")
+
 # --- Tests ---
 
 @pytest.mark.asyncio
@@ -447,6 +546,114 @@ async def test_parallel_with_different_output_keys():
     assert result["sum_task"]["sum"] == 15  # 10 + 5
     assert result["product_task"]["product"] == 20  # 10 * 2
 
+@pytest.mark.asyncio
+async def test_parallel_mixed_sync_and_async_tasks():
+    async def async_add(params, context):
+        await asyncio.sleep(0.01)
+        return {"value": params["input_data"]["value"] + 1}
+
+    async_task = create_task(
+        id="async_add",
+        description="Async add 1 to the input value",
+        input_schema=NumberInput,
+        output_schema=NumberOutput,
+        execute=async_add
+    )
+    sync_task = create_task(
+        id="sync_double",
+        description="Double the input value",
+        input_schema=NumberInput,
+        output_schema=NumberOutput,
+        execute=lambda params, context: {"value": params["input_data"]["value"] * 2}
+    )
+
+    flow = Flow(id="mixed_parallel_flow", description="Test mixed sync and async parallel tasks")
+    flow.parallel([async_task, sync_task]).register()
+
+    result = await flow.run({"value": 10})
+
+    # Results keep the declaration order regardless of how each task was dispatched
+    assert list(result) == ["async_add", "sync_double"]
+    assert result["async_add"]["value"] == 11
+    assert result["sync_double"]["value"] == 20
+
+@pytest.mark.asyncio
+async def test_parallel_async_tasks_overlap_sync_tasks():
+    started = []
+
+    async def async_wait(params, context):
+        started.append("async_wait")
+        await asyncio.sleep(0.2)
+        return params["input_data"]
+
+    def sync_wait(params, context):
+        time.sleep(0.2)
+        return params["input_data"]
+
+    def sync_fail(params, context):
+        raise ValueError("sync failure")
+
+    def make(id, execute):
+        return create_task(id=id, input_schema=NumberInput, output_schema=NumberOutput, execute=execute)
+
+    # Run serially the two tasks take 0.4s; overlapped they take 0.2s, in either declaration order
+    for order in (["async_wait", "sync_wait"], ["sync_wait", "async_wait"]):
+        executes = {"async_wait": async_wait, "sync_wait": sync_wait}
+        flow = Flow(id=f"overlap_flow_{order[0]}").parallel([make(id, executes[id]) for id in order]).register()
+        start = time.perf_counter()
+        await flow.run({"value": 1})
+        assert time.perf_counter() - start < 0.35
+
+    # A failing sync task must not stop its async siblings from starting
+    started.clear()
+    failing = Flow(id="sync_fail_flow").parallel([make("sync_fail", sync_fail), make("async_wait", async_wait)]).register()
+    with pytest.raises(ValueError, match="sync failure"):
+        await failing.run({"value": 1})
+    assert started == ["async_wait"]
+
+@pytest.mark.asyncio
+async def test_parallel_max_concurrency():
+    running = 0
+    peak = 0
+
+    async def track_concurrency(params, context):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return {"value": params["input_data"]["value"]}
+
+    tasks = [
+        create_task(
+            id=f"bounded_{i}",
+            description="Track concurrently running tasks",
+            input_schema=NumberInput,
+            output_schema=NumberOutput,
+            execute=track_concurrency
+        )
+        for i in range(5)
+    ]
+
+    flow = Flow(id="bounded_parallel_flow", description="Test bounded parallel execution")
+    flow.parallel(tasks, max_concurrency=2).register()
+
+    result = await flow.run({"value": 1})
+    assert len(result) == 5
+    assert peak == 2
+
+def test_parallel_invalid_max_concurrency():
+    task = create_task(
+        id="add_task",
+        description="Add 5 to the input value",
+        input_schema=NumberInput,
+        output_schema=NumberOutput,
+        execute=lambda params, context: {"value": params["input_data"]["value"] + 5}
+    )
+    flow = Flow(id="invalid_concurrency_flow", description="Test invalid max_concurrency")
+    with pytest.raises(ValueError, match="max_concurrency must be at least 1"):
+        flow.parallel([task], max_concurrency=0)
+
 @pytest.mark.asyncio
 async def test_empty_parallel_list():
     flow = Flow(id="empty_parallel_flow", description="Test empty parallel task list")
@@ -763,3 +970,340 @@ async def test_loop_then_sequential():
     
     # The result should be 10 (2 -> 3 -> 4 -> 5, then 5 * 2 = 10)
     assert result["value"] == 10
+
+# --- Execution Context Tests ---
+
+@pytest.mark.asyncio
+async def test_context_step_tracking():
+    seen = []
+
+    def record_step(params, context):
+        seen.append((context.task_id, context.step_number))
+        return {"value": params["input_data"]["value"] + 1}
+
+    first = create_task(
+        id="first",
+        description="Record the first step",
+        input_schema=NumberInput,
+        output_schema=NumberOutput,
+        execute=record_step
+    )
+    second = create_task(
+        id="second",
+        description="Record the second step",
+        input_schema=NumberOutput,
+        output_schema=NumberOutput,
+        execute=record_step
+    )
+
+    flow = Flow(id="context_step_flow", description="Test context step tracking")
+    flow.then(first).then(second).register()
+
+    result = await flow.run({"value": 0})
+    assert result["value"] == 2
+    assert seen == [("first", 1), ("second", 2)]
+
+@pytest.mark.asyncio
+async def test_context_track_timing_disabled():
+    start_times = []
+    timestamps = []
+
+    def record_start(params, context):
+        start_times.append(context.step_start_time)
+        timestamps.extend(step["timestamp"] for step in context.get_step_history())
+        return {"value": params["input_data"]["value"] + 1}
+
+    task = create_task(
+        id="record_start",
+        description="Record the step start time",
+        input_schema=NumberInput,
+        output_schema=NumberOutput,
+        execute=record_start
+    )
+
+    flow = Flow(id="no_timing_flow", description="Test disabled step timing")
+    flow.set_metadata("track_timing", False)
+    flow.loop(condition=lambda data: data["value"] < 3, task=task).register()
+
+    result = await flow.run({"value": 0})
+    assert result["value"] == 3
+    assert len(set(start_times)) == 1
+    assert len(set(timestamps)) == 1
+
+@pytest.mark.asyncio
+async def test_context_state_not_shared_between_runs():
+    snapshots = []
+
+    def record_outputs(params, context):
+        snapshots.append((context.execution_id, context.step_number, context.get_all_task_outputs()))
+        return {"value": params["input_data"]["value"] + 1}
+
+    task = create_task(
+        id="record_outputs",
+        description="Record previously stored outputs",
+        input_schema=NumberInput,
+        output_schema=NumberOutput,
+        execute=record_outputs
+    )
+
+    flow = Flow(id="isolated_runs_flow", description="Test run isolation")
+    flow.then(task).register()
+
+    await flow.run({"value": 0})
+    await flow.run({"value": 0})
+
+    assert snapshots[0][1:] == (1, {})
+    assert snapshots[1][1:] == (1, {})
+    assert snapshots[0][0] != snapshots[1][0]
+
+@pytest.mark.asyncio
+async def test_failed_parallel_run_does_not_leak_into_next_run():
+    seen = {}
+
+    async def boom(params, context):
+        raise ValueError("boom")
+
+    async def slow(params, context):
+        await asyncio.sleep(0.05)
+        seen["slow_flow_id"] = context.flow_id
+        context.add_task_output("late", {"value": 0})
+        return params["input_data"]
+
+    def record_outputs(params, context):
+        seen["outputs"] = list(context.get_all_task_outputs())
+        return params["input_data"]
+
+    def make(id, execute):
+        return create_task(id=id, input_schema=NumberInput, output_schema=NumberOutput, execute=execute)
+
+    failing = Flow(id="f").parallel([make("boom", boom), make("slow", slow)]).register()
+    other = Flow(id="g").then(make("record", record_outputs)).register()
+
+    with pytest.raises(ValueError, match="boom"):
+        await failing.run({"value": 1})
+    await other.run({"value": 1})
+    await asyncio.sleep(0.1)
+
+    assert seen["slow_flow_id"] == "f"
+    assert seen["outputs"] == []
+
+# --- Memoization Tests ---
+
+@pytest.mark.asyncio
+async def test_memoized_task_reuses_output():
+    calls = []
+
+    def add_one(params, context):
+        calls.append(params["input_data"]["value"])
+        return {"value": params["input_data"]["value"] + 1}
+
+    task = create_task(
+        id="memo_add_one",
+        description="Add one with memoization",
+        input_schema=NumberInput,
+        output_schema=NumberOutput,
+        execute=add_one,
+        memoize=True
+    )
+
+    flow = Flow(id="memoized_flow", description="Test memoized task")
+    flow.then(task).register()
+
+    assert (await flow.run({"value": 1}))["value"] == 2
+    assert (await flow.run({"value": 1}))["value"] == 2
+    assert (await flow.run({"value": 2}))["value"] == 3
+    assert calls == [1, 2]
+
+    flow.invalidate_cache()
+    assert (await flow.run({"value": 1}))["value"] == 2
+    assert calls == [1, 2, 1]
+
+@pytest.mark.asyncio
+async def test_task_not_memoized_by_default():
+    calls = []
+
+    def add_one(params, context):
+        calls.append(params["input_data"]["value"])
+        return {"value": params["input_data"]["value"] + 1}
+
+    task = create_task(
+        id="plain_add_one",
+        description="Add one without memoization",
+        input_schema=NumberInput,
+        output_schema=NumberOutput,
+        execute=add_one
+    )
+
+    flow = Flow(id="plain_flow", description="Test task without memoization")
+    flow.then(task).register()
+
+    await flow.run({"value": 1})
+    await flow.run({"value": 1})
+    assert calls == [1, 1]
+
+class ItemsOutput(BaseModel):
+    items: list
+
+@pytest.mark.asyncio
+async def test_memoized_output_not_corrupted_by_downstream_mutation():
+    def append_item(params, context):
+        params["input_data"]["items"].append(99)
+        return params["input_data"]
+
+    produce = create_task(
+        id="produce_items",
+        description="Produce a list of items",
+        input_schema=NumberInput,
+        output_schema=ItemsOutput,
+        execute=lambda params, context: {"items": [1]},
+        memoize=True
+    )
+    mutate = create_task(
+        id="append_item",
+        description="Append to the items in place",
+        input_schema=ItemsOutput,
+        output_schema=ItemsOutput,
+        execute=append_item
+    )
+
+    flow = Flow(id="mutating_flow", description="Test memoized outputs are copied")
+    flow.then(produce).then(mutate).register()
+
+    results = [await flow.run({"value": 1}) for _ in range(3)]
+    assert all(result == {"items": [1, 99]} for result in results)
+
+@pytest.mark.asyncio
+async def test_memoized_task_with_uncopyable_output_is_not_cached():
+    calls = []
+
+    def make_lock(params, context):
+        calls.append(params["input_data"]["value"])
+        return {"value": params["input_data"]["value"], "lock": threading.Lock()}
+
+    task = create_task(
+        id="make_lock",
+        description="Return an output that cannot be deep-copied",
+        input_schema=NumberInput,
+        output_schema=NumberOutput,
+        execute=make_lock,
+        memoize=True
+    )
+
+    flow = Flow(id="uncopyable_flow", description="Test uncopyable memoized outputs")
+    flow.then(task).register()
+
+    await flow.run({"value": 1})
+    result = await flow.run({"value": 1})
+    assert result["value"] == 1
+    assert calls == [1, 1]
+
+@pytest.mark.asyncio
+async def test_context_step_history():
+    histories = []
+
+    def record_history(params, context):
+        histories.append(context.get_step_history())
+        return {"value": params["input_data"]["value"] + 1}
+
+    first = create_task(
+        id="first",
+        description="Add one",
+        input_schema=NumberInput,
+        output_schema=NumberOutput,
+        execute=lambda params, context: {"value": params["input_data"]["value"] + 1}
+    )
+    second = create_task(
+        id="second",
+        description="Record the step history",
+        input_schema=NumberOutput,
+        output_schema=NumberOutput,
+        execute=record_history
+    )
+
+    flow = Flow(id="history_flow", description="Test step history")
+    flow.then(first).then(second).register()
+    await flow.run({"value": 0})
+
+    history = histories[0]
+    assert len(history) == 1
+    assert history[0]["task_id"] == "first"
+    assert history[0]["output"] == {"value": 1}
+    assert isinstance(history[0]["timestamp"], str)
+
+def test_child_context_outputs_are_isolated():
+    parent = ExecutionContext(flow_id="flow")
+    parent.add_task_output("first", {"value": 1})
+
+    child = parent.create_child_context("second")
+    assert child.get_task_output("first") == {"value": 1}
+
+    child.add_task_output("second", {"value": 2})
+    parent.add_task_output("third", {"value": 3})
+
+    assert parent.get_task_output("second") is None
+    assert child.get_task_output("third") is None
+    assert [step["task_id"] for step in parent.get_step_history()] == ["first", "third"]
+    assert [step["task_id"] for step in child.get_step_history()] == ["first", "second"]
+
+# --- Server Tests ---
+
+def test_server_run_encodes_non_native_result_types():
+    task = create_task(
+        id="odd_types",
+        description="Return values orjson cannot encode natively",
+        input_schema=NumberInput,
+        output_schema=NumberOutput,
+        execute=lambda params, context: {"s": {1, 2}, "d": Decimal("1.5")}
+    )
+    flow = Flow(id="odd_types_flow").then(task).register()
+    client = TestClient(FlowServer([flow]).get_app())
+
+    response = client.post("/flows/odd_types_flow/run", json={"input_data": {"value": 1}})
+    assert response.status_code == 200
+    assert response.json()["result"] == {"s": [1, 2], "d": "1.5"}
+
+def test_server_run_encodes_big_integers():
+    task = create_task(
+        id="big_int",
+        description="Return an integer beyond 64 bits",
+        input_schema=NumberInput,
+        output_schema=NumberOutput,
+        execute=lambda params, context: {"n": 2 ** 70}
+    )
+    flow = Flow(id="big_int_flow").then(task).register()
+    client = TestClient(FlowServer([flow]).get_app())
+
+    response = client.post("/flows/big_int_flow/run", json={"input_data": {"value": 1}})
+    assert response.status_code == 200
+    assert response.json()["result"] == {"n": 2 ** 70}
+
+def test_server_invalidate_flow_cache():
+    calls = []
+
+    def add_one(params, context):
+        calls.append(params["input_data"]["value"])
+        return {"value": params["input_data"]["value"] + 1}
+
+    task = create_task(
+        id="cached_add_one",
+        description="Add one with memoization",
+        input_schema=NumberInput,
+        output_schema=NumberOutput,
+        execute=add_one,
+        memoize=True
+    )
+    flow = Flow(id="cached_flow").then(task).register()
+    client = TestClient(FlowServer([flow]).get_app())
+
+    client.post("/flows/cached_flow/run", json={"input_data": {"value": 1}})
+    client.post("/flows/cached_flow/run", json={"input_data": {"value": 1}})
+    assert calls == [1]
+
+    response = client.delete("/flows/cached_flow/cache")
+    assert response.status_code == 200
+    assert response.json() == {"flow_id": "cached_flow", "status": "cache_cleared"}
+
+    client.post("/flows/cached_flow/run", json={"input_data": {"value": 1}})
+    assert calls == [1, 1]
+
+    assert client.delete("/flows/missing_flow/cache").status_code == 404
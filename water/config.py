@@ -12,4 +12,7 @@ class Config:
     DEFAULT_MAX_ITERATIONS: int = 100
     
     # Execution settings
-    DEFAULT_TIMEOUT_SECONDS: int = 300
\ No newline at end of file
+    DEFAULT_TIMEOUT_SECONDS: int = 300
+    
+    # Maximum number of memoized outputs kept per task
+    MEMOIZE_CACHE_SIZE: int = 1024
\ No newline at end of file
@@ -1,8 +1,9 @@
 from typing import Any, Dict, Optional, List
-from datetime import datetime
-import uuid
+from datetime import datetime, timedelta
+import time
 
 from water.types import OutputData
+from water.utils import generate_id, utcnow
 
 class ExecutionContext:
     """
@@ -13,6 +14,22 @@ class ExecutionContext:
     and maintain state throughout the flow execution.
     """
     
+    __slots__ = (
+        "flow_id",
+        "_execution_id",
+        "task_id",
+        "step_number",
+        "attempt_number",
+        "_flow_metadata",
+        "track_timing",
+        "_start_wall",
+        "_start_ns",
+        "_step_start_ns",
+        "_task_outputs",
+        "_step_history",
+        "_history_shared",
+    )
+    
     def __init__(
         self,
         flow_id: str,
@@ -34,19 +51,90 @@ class ExecutionContext:
             flow_metadata: Metadata associated with the flow
         """
         self.flow_id = flow_id
-        self.execution_id = execution_id or f"exec_{uuid.uuid4().hex[:8]}"
+        self._execution_id: Optional[str] = execution_id or None
         self.task_id = task_id
         self.step_number = step_number
         self.attempt_number = attempt_number
-        self.flow_metadata = flow_metadata or {}
+        self._flow_metadata: Optional[Dict[str, Any]] = flow_metadata or None
+        
+        # Per-step wall clock timing can be disabled via the "track_timing" flow metadata key
+        self.track_timing: bool = flow_metadata.get("track_timing", True) if flow_metadata else True
+        
+        # Timing information: wall clock time is read once, later instants come
+        # from the monotonic clock and are converted only when observed
+        self._start_wall: datetime = utcnow()
+        self._start_ns: int = time.perf_counter_ns()
+        self._step_start_ns: int = self._start_ns
+        
+        # Task outputs history, allocated on first write. Child contexts share
+        # these containers with their parent and copy them on first write.
+        self._task_outputs: Optional[Dict[str, OutputData]] = None
+        self._step_history: Optional[List[Dict[str, Any]]] = None
+        self._history_shared: bool = False
+    
+    @property
+    def execution_id(self) -> str:
+        """Unique identifier for this execution instance, generated on first access."""
+        if self._execution_id is None:
+            self._execution_id = generate_id("exec")
+        return self._execution_id
+    
+    @execution_id.setter
+    def execution_id(self, value: Optional[str]) -> None:
+        self._execution_id = value
+    
+    @property
+    def flow_metadata(self) -> Dict[str, Any]:
+        """Metadata associated with the flow, allocated on first access."""
+        if self._flow_metadata is None:
+            self._flow_metadata = {}
+        return self._flow_metadata
+    
+    @flow_metadata.setter
+    def flow_metadata(self, value: Optional[Dict[str, Any]]) -> None:
+        self._flow_metadata = value
+    
+    @property
+    def execution_start_time(self) -> datetime:
+        """UTC time at which this execution started."""
+        return self._start_wall
+    
+    @execution_start_time.setter
+    def execution_start_time(self, value: datetime) -> None:
+        self._start_wall = value
+    
+    @property
+    def step_start_time(self) -> datetime:
+        """UTC time at which the current step started."""
+        return self._wall_time(self._step_start_ns)
+    
+    @step_start_time.setter
+    def step_start_time(self, value: datetime) -> None:
+        self._step_start_ns = self._start_ns + (value - self._start_wall) // timedelta(microseconds=1) * 1000
+    
+    def _wall_time(self, ns: int) -> datetime:
+        """Convert a time.perf_counter_ns() reading to UTC wall clock time."""
+        return self._start_wall + timedelta(microseconds=(ns - self._start_ns) // 1000)
+    
+    def _enter_step(self, task_id: str, attempt_number: int = 1) -> 'ExecutionContext':
+        """
+        Advance this context in place to the next task step.
         
-        # Timing information
-        self.execution_start_time = datetime.utcnow()
-        self.step_start_time = datetime.utcnow()
+        Used by the execution engine instead of allocating a child context per step.
         
-        # Task outputs history
-        self._task_outputs: Dict[str, OutputData] = {}
-        self._step_history: List[Dict[str, Any]] = []
+        Args:
+            task_id: Identifier of the task about to execute
+            attempt_number: Attempt number for retry scenarios
+            
+        Returns:
+            Self, updated for the new step
+        """
+        self.task_id = task_id
+        self.step_number += 1
+        self.attempt_number = attempt_number
+        if self.track_timing:
+            self._step_start_ns = time.perf_counter_ns()
+        return self
     
     def add_task_output(self, task_id: str, output: OutputData) -> None:
         """
@@ -56,13 +144,21 @@ class ExecutionContext:
             task_id: Identifier of the completed task
             output: Output data from the task
         """
+        if self._task_outputs is None:
+            self._task_outputs = {}
+            self._step_history = []
+        elif self._history_shared:
+            self._task_outputs = self._task_outputs.copy()
+            self._step_history = self._step_history.copy()
+            self._history_shared = False
         self._task_outputs[task_id] = output
         
+        # Without timing, steps are stamped with the last recorded step start instead of reading the clock
         step_info = {
             "step_number": self.step_number,
             "task_id": task_id,
             "output": output,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": time.perf_counter_ns() if self.track_timing else self._step_start_ns,
             "attempt_number": self.attempt_number
         }
         self._step_history.append(step_info)
@@ -77,6 +173,8 @@ class ExecutionContext:
         Returns:
             Task output data, or None if task hasn't executed
         """
+        if self._task_outputs is None:
+            return None
         return self._task_outputs.get(task_id)
     
     def get_all_task_outputs(self) -> Dict[str, OutputData]:
@@ -86,6 +184,8 @@ class ExecutionContext:
         Returns:
             Dictionary mapping task IDs to their output data
         """
+        if self._task_outputs is None:
+            return {}
         return self._task_outputs.copy()
     
     def get_step_history(self) -> List[Dict[str, Any]]:
@@ -95,7 +195,13 @@ class ExecutionContext:
         Returns:
             List of step execution records with timestamps and outputs
         """
-        return self._step_history.copy()
+        if self._step_history is None:
+            return []
+        # Timestamps are stored as monotonic clock readings and only formatted when read
+        return [
+            {**step_info, "timestamp": self._wall_time(step_info["timestamp"]).isoformat()}
+            for step_info in self._step_history
+        ]
     
     def create_child_context(
         self, 
@@ -122,13 +228,19 @@ class ExecutionContext:
             task_id=task_id,
             step_number=step_number or (self.step_number + 1),
             attempt_number=attempt_number,
-            flow_metadata=self.flow_metadata
+            flow_metadata=self._flow_metadata
         )
         
-        # Copy task outputs and history to child
-        child_context._task_outputs = self._task_outputs.copy()
-        child_context._step_history = self._step_history.copy()
-        child_context.execution_start_time = self.execution_start_time
+        # Share task outputs and history with the child; whichever side
+        # records an output next copies them first
+        if self._task_outputs is not None:
+            child_context._task_outputs = self._task_outputs
+            child_context._step_history = self._step_history
+            child_context._history_shared = True
+            self._history_shared = True
+        child_context._start_wall = self._start_wall
+        child_context._start_ns = self._start_ns
+        child_context.track_timing = self.track_timing
         
         return child_context
     
@@ -148,8 +260,8 @@ class ExecutionContext:
             "flow_metadata": self.flow_metadata,
             "execution_start_time": self.execution_start_time.isoformat(),
             "step_start_time": self.step_start_time.isoformat(),
-            "task_outputs": self._task_outputs,
-            "step_history": self._step_history
+            "task_outputs": self._task_outputs if self._task_outputs is not None else {},
+            "step_history": self.get_step_history()
         }
     
     def __repr__(self) -> str:
@@ -1,19 +1,20 @@
-import inspect
 import asyncio
 import logging
 from enum import Enum
-from typing import Any, Dict, List
-from datetime import datetime
+from typing import Any, Dict, Optional
 
 from water.types import (
     ExecutionGraph, 
     ExecutionNode, 
+    ExecutionPlan,
+    NodeHandler, 
     InputData, 
     OutputData,
     SequentialNode,
     ParallelNode,
     BranchNode,
-    LoopNode
+    LoopNode,
+    NodeKind
 )
 from water.context import ExecutionContext
 
@@ -34,12 +35,29 @@ class ExecutionEngine:
     parallel execution, conditional branching, and loops.
     """
     
+    @staticmethod
+    def compile(execution_graph: ExecutionGraph) -> ExecutionPlan:
+        """
+        Resolve the handler of every node in an execution graph ahead of time.
+        
+        Args:
+            execution_graph: List of execution nodes to compile
+            
+        Returns:
+            Tuple of (handler, node) pairs in execution order
+            
+        Raises:
+            ValueError: If a node type is unknown
+        """
+        return tuple((ExecutionEngine._resolve_handler(node), node) for node in execution_graph)
+    
     @staticmethod
     async def run(
         execution_graph: ExecutionGraph, 
         input_data: InputData,
         flow_id: str,
-        flow_metadata: Dict[str, Any] = None
+        flow_metadata: Dict[str, Any] = None,
+        plan: Optional[ExecutionPlan] = None
     ) -> OutputData:
         """
         Execute a complete flow execution graph.
@@ -49,59 +67,46 @@ class ExecutionEngine:
             input_data: Initial input data
             flow_id: Unique identifier for the flow execution
             flow_metadata: Optional metadata for the flow
+            plan: Precompiled plan for execution_graph. Compiled on the fly if not provided.
             
         Returns:
             Final output data after all nodes are executed
+            
+        Raises:
+            ValueError: If a node type is unknown
         """
-        context = ExecutionContext(
-            flow_id=flow_id,
-            flow_metadata=flow_metadata or {}
-        )
+        if plan is None:
+            plan = ExecutionEngine.compile(execution_graph)
+        
+        context = ExecutionContext(flow_id=flow_id, flow_metadata=flow_metadata)
         
         data: OutputData = input_data
         
-        for node in execution_graph:
-            data = await ExecutionEngine._execute_node(node, data, context)
+        # Handlers are already resolved, so each node costs a single awaited call
+        for handler, node in plan:
+            data = await handler(node, data, context)
         
         return data
     
     @staticmethod
-    async def _execute_node(
-        node: ExecutionNode, 
-        data: InputData, 
-        context: ExecutionContext
-    ) -> OutputData:
+    def _resolve_handler(node: ExecutionNode) -> NodeHandler:
         """
-        Route execution to the appropriate node type handler.
+        Look up the handler for a node type.
         
         Args:
-            node: The execution node to process
-            data: Input data for the node
-            context: Execution context
+            node: The execution node to resolve
             
         Returns:
-            Output data from the node execution
+            The handler coroutine function for the node
             
         Raises:
-            ValueError: If node type is unknown or unhandled
+            ValueError: If node type is unknown
         """
-        try:
-            node_type = NodeType(node["type"])
-        except ValueError:
-            raise ValueError(f"Unknown node type: {node['type']}")
+        kind = getattr(node, "kind", None)
+        if not isinstance(kind, NodeKind):
+            raise ValueError(f"Unknown node type: {getattr(node, 'type', node)}")
         
-        handlers = {
-            NodeType.SEQUENTIAL: ExecutionEngine._execute_sequential,
-            NodeType.PARALLEL: ExecutionEngine._execute_parallel,
-            NodeType.BRANCH: ExecutionEngine._execute_branch,
-            NodeType.LOOP: ExecutionEngine._execute_loop,
-        }
-        
-        handler = handlers.get(node_type)
-        if not handler:
-            raise ValueError(f"Unhandled node type: {node_type}")
-            
-        return await handler(node, data, context)
+        return _NODE_HANDLERS[kind]
     
     @staticmethod
     async def _execute_task(task: Any, data: InputData, context: ExecutionContext) -> OutputData:
@@ -118,16 +123,22 @@ class ExecutionEngine:
         """
         params: Dict[str, InputData] = {"input_data": data}
         
-        # Update context with current task info
-        context.task_id = task.id
-        context.step_start_time = datetime.utcnow()
-        context.step_number += 1
+        # Advance the shared context in place rather than allocating a child per step
+        context._enter_step(task.id)
         
-        # Execute the task
-        if inspect.iscoroutinefunction(task.execute):
-            result = await task.execute(params, context)
+        # Serve memoized tasks from their cache when the same input was seen before
+        cache_key = task._cache_key(data) if task._memoize else None
+        if cache_key is not None and cache_key in task._cache:
+            result = task._cached_result(cache_key)
         else:
-            result = task.execute(params, context)
+            # Execute the task
+            if task._is_coro:
+                result = await task._execute(params, context)
+            else:
+                result = task._execute(params, context)
+            
+            if cache_key is not None:
+                task._store_result(cache_key, result)
         
         # Store the task result in context for future tasks to access
         context.add_task_output(task.id, result)
@@ -151,7 +162,7 @@ class ExecutionEngine:
         Returns:
             Task execution result
         """
-        task = node["task"]
+        task = node.task
         return await ExecutionEngine._execute_task(task, data, context)
     
     @staticmethod
@@ -171,19 +182,50 @@ class ExecutionEngine:
         Returns:
             Dictionary mapping task IDs to their results
         """
-        tasks = node["tasks"]
-        
-        # Create task execution coroutines
-        async def execute_single_task(task):
-            return await ExecutionEngine._execute_task(task, data, context)
+        tasks = node.tasks
+        execute_task = ExecutionEngine._execute_task
+        async_tasks = [task for task in tasks if task._is_coro]
         
-        coroutines = [execute_single_task(task) for task in tasks]
-        
-        # Execute all tasks in parallel
-        results: List[OutputData] = await asyncio.gather(*coroutines)
-        
-        # Organize results by task ID
-        parallel_results = {task.id: result for task, result in zip(tasks, results)}
+        if not async_tasks or len(tasks) == 1:
+            # Nothing here can overlap on the event loop, so run the tasks inline
+            # instead of wrapping each one in a scheduled asyncio.Task
+            parallel_results = {task.id: await execute_task(task, data, context) for task in tasks}
+        else:
+            max_concurrency = node.max_concurrency
+            if max_concurrency is not None and len(async_tasks) > max_concurrency:
+                # Bound how many tasks are in flight for large fan-outs
+                semaphore = asyncio.Semaphore(max_concurrency)
+                
+                async def execute_bounded(task: Any) -> OutputData:
+                    async with semaphore:
+                        return await execute_task(task, data, context)
+                
+                coroutines = [execute_bounded(task) for task in async_tasks]
+            else:
+                coroutines = [execute_task(task, data, context) for task in async_tasks]
+            
+            # Schedule the async tasks before any sync task blocks the event loop,
+            # so they overlap sync work regardless of declaration order
+            pending = asyncio.gather(*coroutines)
+            results: Dict[str, OutputData] = {}
+            
+            if len(async_tasks) < len(tasks):
+                try:
+                    # Yield once so every async task reaches its first await
+                    await asyncio.sleep(0)
+                    for task in tasks:
+                        if not task._is_coro:
+                            results[task.id] = await execute_task(task, data, context)
+                except BaseException:
+                    # Async siblings keep running, as with a plain gather; mark their outcome retrieved
+                    pending.add_done_callback(lambda future: future.cancelled() or future.exception())
+                    raise
+            
+            for task, result in zip(async_tasks, await pending):
+                results[task.id] = result
+            
+            # Organize results by task ID, in declaration order
+            parallel_results = {task.id: results[task.id] for task in tasks}
         
         # Store individual parallel results in context (they were already stored by _execute_task)
         # but also store the combined parallel results as a special entry
@@ -208,14 +250,9 @@ class ExecutionEngine:
         Returns:
             Result from the executed branch, or input data if no conditions match
         """
-        branches = node["branches"]
-        
-        for branch in branches:
-            condition = branch["condition"]
-            
-            if condition(data):
-                task = branch["task"]
-                return await ExecutionEngine._execute_task(task, data, context)
+        task = node.dispatch(data)
+        if task is not None:
+            return await ExecutionEngine._execute_task(task, data, context)
         
         # If no condition matched, return data unchanged
         return data
@@ -237,10 +274,12 @@ class ExecutionEngine:
         Returns:
             Final data after loop completion
         """
-        condition = node["condition"]
-        task = node["task"]
-        max_iterations: int = node.get("max_iterations", 100)
+        condition = node.condition
+        task = node.task
+        max_iterations: int = node.max_iterations
         
+        # Resolve the dispatcher once; the shared context is advanced in place each iteration
+        execute_task = ExecutionEngine._execute_task
         iteration_count: int = 0
         current_data: OutputData = data
         
@@ -248,10 +287,18 @@ class ExecutionEngine:
             if not condition(current_data):
                 break
             
-            current_data = await ExecutionEngine._execute_task(task, current_data, context)
+            current_data = await execute_task(task, current_data, context)
             iteration_count += 1
         
         if iteration_count >= max_iterations:
             logger.warning(f"Loop reached maximum iterations ({max_iterations}) for flow {context.flow_id}")
             
-        return current_data
\ No newline at end of file
+        return current_data
+
+# Handlers indexed by NodeKind, so dispatch is a single tuple load
+_NODE_HANDLERS = (
+    ExecutionEngine._execute_sequential,
+    ExecutionEngine._execute_parallel,
+    ExecutionEngine._execute_branch,
+    ExecutionEngine._execute_loop,
+)
@@ -1,15 +1,46 @@
 from typing import Any, List, Optional, Tuple, Dict
 import inspect
-import uuid
 
-from water.execution_engine import ExecutionEngine, NodeType
+from water.execution_engine import ExecutionEngine
+from water.utils import generate_id
 from water.types import (
     InputData, 
     OutputData, 
     ConditionFunction,
-    ExecutionNode
+    BranchDispatchFunction,
+    ExecutionNode,
+    ExecutionPlan,
+    SequentialNode,
+    ParallelNode,
+    BranchNode,
+    LoopNode
 )
 
+def _make_branch_dispatcher(
+    conditions: Tuple[ConditionFunction, ...],
+    tasks: Tuple[Any, ...]
+) -> BranchDispatchFunction:
+    """
+    Build a function that returns the task of the first branch whose condition matches.
+    
+    The conditions are scanned as one contiguous tuple and the matching task is
+    fetched by index, so evaluating a branch node avoids per-branch lookups.
+    
+    Args:
+        conditions: Branch conditions in declaration order
+        tasks: Tasks aligned with conditions
+        
+    Returns:
+        Dispatch function returning the matching task, or None if no condition matches
+    """
+    def dispatch(data: InputData) -> Optional[Any]:
+        for index, condition in enumerate(conditions):
+            if condition(data):
+                return tasks[index]
+        return None
+    
+    return dispatch
+
 class Flow:
     """
     A workflow orchestrator that allows building and executing complex data processing pipelines.
@@ -30,10 +61,12 @@ class Flow:
             id: Unique identifier for the flow. Auto-generated if not provided.
             description: Human-readable description of the flow's purpose.
         """
-        self.id: str = id if id else f"flow_{uuid.uuid4().hex[:8]}"
+        self.id: str = id if id else generate_id("flow")
         self.description: str = description if description else f"Flow {self.id}"
         self._tasks: List[ExecutionNode] = []
+        self._graph: Optional[Tuple[ExecutionNode, ...]] = None
         self._registered: bool = False
+        self._plan: Optional[ExecutionPlan] = None
         self.metadata: Dict[str, Any] = {}
     
     def _validate_registration_state(self) -> None:
@@ -87,35 +120,36 @@ class Flow:
         self._validate_registration_state()
         self._validate_task(task)
         
-        node: ExecutionNode = {"type": NodeType.SEQUENTIAL.value, "task": task}
+        node: ExecutionNode = SequentialNode(task)
         self._tasks.append(node)
         return self
 
-    def parallel(self, tasks: List[Any]) -> 'Flow':
+    def parallel(self, tasks: List[Any], max_concurrency: Optional[int] = None) -> 'Flow':
         """
         Add tasks to execute in parallel.
         
         Args:
             tasks: List of tasks to execute concurrently
+            max_concurrency: Maximum number of async tasks running at once.
+                Unbounded if not provided.
             
         Returns:
             Self for method chaining
             
         Raises:
             RuntimeError: If flow is already registered
-            ValueError: If task list is empty or contains None values
+            ValueError: If task list is empty, contains None values, or max_concurrency is less than 1
         """
         self._validate_registration_state()
         if not tasks:
             raise ValueError("Parallel task list cannot be empty")
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
         
         for task in tasks:
             self._validate_task(task)
         
-        node: ExecutionNode = {
-            "type": NodeType.PARALLEL.value,
-            "tasks": list(tasks)
-        }
+        node: ExecutionNode = ParallelNode(tuple(tasks), max_concurrency)
         self._tasks.append(node)
         return self
 
@@ -144,10 +178,9 @@ class Flow:
             self._validate_task(task)
             self._validate_condition(condition)
         
-        node: ExecutionNode = {
-            "type": NodeType.BRANCH.value,
-            "branches": [{"condition": cond, "task": task} for cond, task in branches]
-        }
+        conditions = tuple(condition for condition, _ in branches)
+        tasks = tuple(task for _, task in branches)
+        node: ExecutionNode = BranchNode(conditions, tasks, _make_branch_dispatcher(conditions, tasks))
         self._tasks.append(node)
         return self
 
@@ -176,21 +209,32 @@ class Flow:
         self._validate_task(task)
         self._validate_loop_condition(condition)
         
-        node: ExecutionNode = {
-            "type": NodeType.LOOP.value,
-            "condition": condition,
-            "task": task,
-            "max_iterations": max_iterations
-        }
+        node: ExecutionNode = LoopNode(condition, task, max_iterations)
         self._tasks.append(node)
         return self
 
+    def invalidate_cache(self) -> 'Flow':
+        """
+        Discard the memoized outputs of every task in this flow.
+        
+        Returns:
+            Self for method chaining
+        """
+        for node in self._tasks:
+            if isinstance(node, (ParallelNode, BranchNode)):
+                for task in node.tasks:
+                    task.invalidate_cache()
+            else:
+                node.task.invalidate_cache()
+        return self
+
     def register(self) -> 'Flow':
         """
         Register the flow for execution.
         
         Must be called before running the flow.
-        Once registered, no more tasks can be added.
+        Once registered, no more tasks can be added and the graph is compiled
+        into an execution plan that every run reuses.
         
         Returns:
             Self for method chaining
@@ -200,6 +244,9 @@ class Flow:
         """
         if not self._tasks:
             raise ValueError("Flow must have at least one task")
+        # Freeze the graph so concurrent runs share an immutable node sequence
+        self._graph = tuple(self._tasks)
+        self._plan = ExecutionEngine.compile(self._graph)
         self._registered = True
         return self
 
@@ -220,8 +267,9 @@ class Flow:
             raise RuntimeError("Flow must be registered before running")
         
         return await ExecutionEngine.run(
-            self._tasks, 
+            self._graph, 
             input_data, 
             flow_id=self.id,
-            flow_metadata=self.metadata
+            flow_metadata=self.metadata,
+            plan=self._plan
         )
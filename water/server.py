@@ -1,11 +1,83 @@
 from typing import List, Dict, Any, Optional, Type
+from functools import lru_cache
 from fastapi import FastAPI, HTTPException
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel
+from pydantic_core import PydanticSerializationError, to_json, to_jsonable_python
 from datetime import datetime
+import time
+import orjson
 
 from water.flow import Flow
+from water.utils import utcnow
+from water.types import ExecutionGraph
 
 
+def _orjson_default(obj: Any) -> Any:
+    """
+    Serialize objects orjson does not handle natively.
+    
+    Falls back to Pydantic's JSON rules, so task results containing models, sets,
+    Decimals and similar types encode the same way they do through a response_model.
+    """
+    try:
+        return to_jsonable_python(obj)
+    except PydanticSerializationError:
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable") from None
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson, which is much faster than stdlib json for large results."""
+    
+    def render(self, content: Any) -> bytes:
+        try:
+            return orjson.dumps(content, default=_orjson_default, option=orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            # orjson rejects some values outright, such as integers beyond 64 bits,
+            # without consulting the default hook, so let Pydantic encode those
+            return to_json(content)
+
+@lru_cache(maxsize=None)
+def _schema_fields(schema_class: Type[BaseModel]) -> Dict[str, str]:
+    """
+    Build the field:type mapping for a Pydantic model.
+    
+    Schema classes are immutable once defined, so the mapping is computed once
+    per class and shared by every task and server that uses it.
+    
+    Args:
+        schema_class: Pydantic BaseModel class
+        
+    Returns:
+        Dictionary mapping field names to simplified type strings
+    """
+    try:
+        schema_dict = {}
+        for field_name, field_info in schema_class.model_fields.items():
+            # Simple type mapping - much simpler than before
+            field_type = field_info.annotation
+            type_name = getattr(field_type, '__name__', str(field_type))
+            
+            # Basic type cleanup
+            if 'int' in type_name.lower():
+                schema_dict[field_name] = "int"
+            elif 'float' in type_name.lower():
+                schema_dict[field_name] = "float"
+            elif 'str' in type_name.lower():
+                schema_dict[field_name] = "string"
+            elif 'bool' in type_name.lower():
+                schema_dict[field_name] = "boolean"
+            elif 'list' in type_name.lower():
+                schema_dict[field_name] = "array"
+            elif 'dict' in type_name.lower():
+                schema_dict[field_name] = "object"
+            else:
+                schema_dict[field_name] = type_name
+        
+        return schema_dict
+        
+    except Exception:
+        return {"error": "Could not parse schema"}
+
 class RunFlowRequest(BaseModel):
     """Request model for flow execution."""
     input_data: Dict[str, Any]
@@ -75,6 +147,20 @@ class FlowServer:
             if not flow._registered:
                 raise ValueError(f"Flow {flow.id} must be registered before adding to server")
             self.flows[flow.id] = flow
+        
+        # Registered flows cannot change shape, so their task listings are built once
+        self._task_infos: Dict[str, List[TaskInfo]] = {
+            flow_id: self._extract_task_info(flow._graph)
+            for flow_id, flow in self.flows.items()
+        }
+        self._flows_list = FlowsListResponse(flows=[
+            FlowSummary(
+                id=flow.id,
+                description=flow.description,
+                tasks=self._task_infos[flow.id],
+            )
+            for flow in self.flows.values()
+        ])
     
     def _serialize_schema(self, schema_class: Type[BaseModel]) -> Optional[Dict[str, str]]:
         """
@@ -89,40 +175,14 @@ class FlowServer:
         if not schema_class:
             return None
         
-        try:
-            schema_dict = {}
-            for field_name, field_info in schema_class.model_fields.items():
-                # Simple type mapping - much simpler than before
-                field_type = field_info.annotation
-                type_name = getattr(field_type, '__name__', str(field_type))
-                
-                # Basic type cleanup
-                if 'int' in type_name.lower():
-                    schema_dict[field_name] = "int"
-                elif 'float' in type_name.lower():
-                    schema_dict[field_name] = "float"
-                elif 'str' in type_name.lower():
-                    schema_dict[field_name] = "string"
-                elif 'bool' in type_name.lower():
-                    schema_dict[field_name] = "boolean"
-                elif 'list' in type_name.lower():
-                    schema_dict[field_name] = "array"
-                elif 'dict' in type_name.lower():
-                    schema_dict[field_name] = "object"
-                else:
-                    schema_dict[field_name] = type_name
-            
-            return schema_dict
-            
-        except Exception:
-            return {"error": "Could not parse schema"}
+        return _schema_fields(schema_class)
     
-    def _extract_task_info(self, execution_nodes: List[Dict[str, Any]]) -> List[TaskInfo]:
+    def _extract_task_info(self, execution_nodes: ExecutionGraph) -> List[TaskInfo]:
         """
         Extract task information from execution nodes.
         
         Args:
-            execution_nodes: List of execution node dictionaries
+            execution_nodes: List of execution nodes
             
         Returns:
             List of TaskInfo objects
@@ -130,10 +190,10 @@ class FlowServer:
         task_infos = []
         
         for node in execution_nodes:
-            node_type = node["type"]
+            node_type = node.type
             
             if node_type == "sequential":
-                task = node["task"]
+                task = node.task
                 task_infos.append(TaskInfo(
                     id=task.id,
                     description=task.description,
@@ -143,7 +203,7 @@ class FlowServer:
                 ))
             
             elif node_type == "parallel":
-                for task in node["tasks"]:
+                for task in node.tasks:
                     task_infos.append(TaskInfo(
                         id=task.id,
                         description=task.description,
@@ -153,8 +213,7 @@ class FlowServer:
                     ))
             
             elif node_type == "branch":
-                for branch in node["branches"]:
-                    task = branch["task"]
+                for task in node.tasks:
                     task_infos.append(TaskInfo(
                         id=task.id,
                         description=task.description,
@@ -164,7 +223,7 @@ class FlowServer:
                     ))
             
             elif node_type == "loop":
-                task = node["task"]
+                task = node.task
                 task_infos.append(TaskInfo(
                     id=task.id,
                     description=task.description,
@@ -185,7 +244,8 @@ class FlowServer:
         app = FastAPI(
             title="Water Flows API",
             description="REST API for executing Water framework workflows",
-            version="1.0.0"
+            version="1.0.0",
+            default_response_class=ORJSONResponse
         )
         
         # Add CORS middleware for development
@@ -204,22 +264,13 @@ class FlowServer:
             return {
                 "status": "healthy",
                 "flows_count": len(self.flows),
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": utcnow().isoformat()
             }
         
         @app.get("/flows", response_model=FlowsListResponse)
         async def list_flows():
             """Get list of all available flows."""
-            flows_summary = []
-            for flow in self.flows.values():
-                task_infos = self._extract_task_info(flow._tasks)
-                flows_summary.append(FlowSummary(
-                    id=flow.id,
-                    description=flow.description,
-                    tasks=task_infos,
-                ))
-            
-            return FlowsListResponse(flows=flows_summary)
+            return self._flows_list
         
         @app.get("/flows/{flow_id}", response_model=FlowDetail)
         async def get_flow_details(flow_id: str):
@@ -228,15 +279,23 @@ class FlowServer:
                 raise HTTPException(status_code=404, detail=f"Flow '{flow_id}' not found")
             
             flow = self.flows[flow_id]
-            task_infos = self._extract_task_info(flow._tasks)
             
             return FlowDetail(
                 id=flow.id,
                 description=flow.description,
                 metadata=flow.metadata,
-                tasks=task_infos,
+                tasks=self._task_infos[flow_id],
             )
         
+        @app.delete("/flows/{flow_id}/cache")
+        async def invalidate_flow_cache(flow_id: str):
+            """Discard memoized task outputs for a specific flow."""
+            if flow_id not in self.flows:
+                raise HTTPException(status_code=404, detail=f"Flow '{flow_id}' not found")
+            
+            self.flows[flow_id].invalidate_cache()
+            return {"flow_id": flow_id, "status": "cache_cleared"}
+        
         @app.post("/flows/{flow_id}/run", response_model=RunFlowResponse)
         async def run_flow(flow_id: str, request: RunFlowRequest):
             """Execute a specific flow with input data."""
@@ -246,19 +305,19 @@ class FlowServer:
             flow = self.flows[flow_id]
             
             try:
-                start_time = datetime.utcnow()
+                start_time = time.perf_counter()
                 result = await flow.run(request.input_data)
-                end_time = datetime.utcnow()
+                execution_time_ms = round((time.perf_counter() - start_time) * 1000, 4)
                 
-                execution_time_ms = round((end_time - start_time).total_seconds() * 1000, 4)
-                
-                return RunFlowResponse(
-                    flow_id=flow_id,
-                    status="success",
-                    result=result,
-                    execution_time_ms=execution_time_ms,
-                    timestamp=end_time
-                )
+                # Return the response directly so FastAPI skips re-validating and
+                # re-encoding the (possibly large) result through RunFlowResponse
+                return ORJSONResponse({
+                    "flow_id": flow_id,
+                    "status": "success",
+                    "result": result,
+                    "execution_time_ms": execution_time_ms,
+                    "timestamp": utcnow()
+                })
                 
             except Exception as e:
                 raise HTTPException(
@@ -1,13 +1,18 @@
-from typing import Type, Callable, Optional, Dict
+from typing import Any, Type, Optional, Union
+from collections import OrderedDict
+import copy
+import hashlib
+import inspect
+import pickle
 from pydantic import BaseModel
+from water.config import Config
 from water.exceptions import WaterError
-import uuid
+from water.utils import generate_id
 
 # Import here to avoid circular imports
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
-    from water.types import InputData, OutputData
-    from water.context import ExecutionContext
+    from water.types import OutputData, TaskExecuteFunction, AsyncTaskExecuteFunction
 
 class Task:
     """
@@ -18,13 +23,25 @@ class Task:
     or asynchronous.
     """
     
+    __slots__ = (
+        "id",
+        "description",
+        "input_schema",
+        "output_schema",
+        "_execute",
+        "_is_coro",
+        "_memoize",
+        "_cache",
+    )
+    
     def __init__(
         self, 
         input_schema: Type[BaseModel],
         output_schema: Type[BaseModel],
-        execute: Callable[[Dict[str, 'InputData'], 'ExecutionContext'], 'OutputData'], 
+        execute: Union['TaskExecuteFunction', 'AsyncTaskExecuteFunction'], 
         id: Optional[str] = None, 
-        description: Optional[str] = None
+        description: Optional[str] = None,
+        memoize: bool = False
     ) -> None:
         """
         Initialize a new Task.
@@ -32,14 +49,16 @@ class Task:
         Args:
             input_schema: Pydantic BaseModel class defining expected input structure
             output_schema: Pydantic BaseModel class defining output structure
-            execute: Function that processes input data and returns output
+            execute: Sync or async function that processes input data and returns output
             id: Unique identifier for the task. Auto-generated if not provided.
             description: Human-readable description of the task's purpose
+            memoize: Reuse the stored output when the task runs again with identical input.
+                Only enable this for tasks whose output depends solely on their input data.
             
         Raises:
             WaterError: If schemas are not Pydantic BaseModel classes or execute is not callable
         """
-        self.id: str = id if id else f"task_{uuid.uuid4().hex[:8]}"
+        self.id: str = id if id else generate_id("task")
         self.description: str = description if description else f"Task {self.id}"
         
         # Validate schemas are Pydantic BaseModel classes
@@ -53,6 +72,63 @@ class Task:
         self.input_schema = input_schema
         self.output_schema = output_schema
         self.execute = execute
+        
+        # Memoized outputs keyed by input fingerprint, evicted least recently used first
+        self._memoize: bool = memoize
+        self._cache: 'OrderedDict[bytes, OutputData]' = OrderedDict()
+    
+    @property
+    def execute(self) -> Union['TaskExecuteFunction', 'AsyncTaskExecuteFunction']:
+        """Function that processes input data and returns output."""
+        return self._execute
+    
+    @execute.setter
+    def execute(self, execute: Union['TaskExecuteFunction', 'AsyncTaskExecuteFunction']) -> None:
+        # Resolve sync vs async once here instead of on every execution
+        self._execute = execute
+        self._is_coro: bool = inspect.iscoroutinefunction(execute)
+    
+    def _cache_key(self, input_data: Any) -> Optional[bytes]:
+        """
+        Fingerprint input data for memoization.
+        
+        Args:
+            input_data: Input data passed to the task
+            
+        Returns:
+            Digest of the input, or None if the input cannot be fingerprinted
+        """
+        try:
+            if isinstance(input_data, BaseModel):
+                payload = input_data.model_dump_json().encode()
+            else:
+                payload = pickle.dumps(input_data, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            return None
+        return hashlib.blake2b(payload, digest_size=16).digest()
+    
+    def _cached_result(self, key: bytes) -> 'OutputData':
+        """Return a copy of a memoized output, marking it as recently used."""
+        self._cache.move_to_end(key)
+        # Downstream tasks may mutate their input, so the cached output is never handed out
+        return copy.deepcopy(self._cache[key])
+    
+    def _store_result(self, key: bytes, output: 'OutputData') -> None:
+        """
+        Store a copy of a memoized output, evicting the oldest entry when the cache is full.
+        
+        Outputs that cannot be copied, such as ones holding locks or clients, are not cached.
+        """
+        try:
+            self._cache[key] = copy.deepcopy(output)
+        except Exception:
+            return
+        if len(self._cache) > Config.MEMOIZE_CACHE_SIZE:
+            self._cache.popitem(last=False)
+    
+    def invalidate_cache(self) -> None:
+        """Discard all memoized outputs of this task."""
+        self._cache.clear()
 
    
 def create_task(
@@ -60,7 +136,8 @@ def create_task(
     description: Optional[str] = None, 
     input_schema: Optional[Type[BaseModel]] = None, 
     output_schema: Optional[Type[BaseModel]] = None, 
-    execute: Optional[Callable[[Dict[str, 'InputData'], 'ExecutionContext'], 'OutputData']] = None
+    execute: Optional[Union['TaskExecuteFunction', 'AsyncTaskExecuteFunction']] = None,
+    memoize: bool = False
 ) -> Task:
     """
     Factory function to create a Task instance.
@@ -71,4 +148,5 @@ def create_task(
         execute=execute,
         id=id,
         description=description,
+        memoize=memoize,
     )
\ No newline at end of file
@@ -1,5 +1,5 @@
-from typing import Any, Callable, Dict, List, Union
-from typing_extensions import TypedDict
+from enum import IntEnum
+from typing import Any, Awaitable, Callable, Dict, Final, Optional, Sequence, Tuple, Union
 
 # Forward declaration for ExecutionContext
 from typing import TYPE_CHECKING
@@ -12,32 +12,84 @@ InputData = Dict[str, Any]
 OutputData = Dict[str, Any]
 ConditionFunction = Callable[[InputData], bool]
 
+# Returns the task of the first matching branch, or None if no condition matches
+BranchDispatchFunction = Callable[[InputData], Optional['Task']]
+
 # Updated task execution function signature to include context
 TaskExecuteFunction = Callable[[Dict[str, InputData], 'ExecutionContext'], OutputData]
 
-# TypedDict definitions for node structures
-class SequentialNode(TypedDict):
-    type: str
-    task: 'Task'
+# Coroutine variant for I/O-bound tasks; parallel nodes gather these concurrently
+AsyncTaskExecuteFunction = Callable[[Dict[str, InputData], 'ExecutionContext'], Awaitable[OutputData]]
+
+class NodeKind(IntEnum):
+    """Integer discriminator used by the engine to index its handler table."""
+    SEQUENTIAL = 0
+    PARALLEL = 1
+    BRANCH = 2
+    LOOP = 3
 
-class ParallelNode(TypedDict):
-    type: str
-    tasks: List['Task']
+# Node records use __slots__ so the engine reads fixed attributes instead of probing a dict.
+# The node type and kind are class attributes, shared by every node of that kind.
+class SequentialNode:
+    """A single task executed in order."""
+    
+    __slots__ = ("task",)
+    
+    type: Final = "sequential"
+    kind: Final = NodeKind.SEQUENTIAL
+    
+    def __init__(self, task: 'Task') -> None:
+        self.task = task
 
-class BranchCondition(TypedDict):
-    condition: ConditionFunction
-    task: 'Task'
+class ParallelNode:
+    """Tasks executed concurrently on the same input."""
+    
+    __slots__ = ("tasks", "max_concurrency")
+    
+    type: Final = "parallel"
+    kind: Final = NodeKind.PARALLEL
+    
+    def __init__(self, tasks: Tuple['Task', ...], max_concurrency: Optional[int] = None) -> None:
+        self.tasks = tasks
+        self.max_concurrency = max_concurrency
 
-class BranchNode(TypedDict):
-    type: str
-    branches: List[BranchCondition]
+class BranchNode:
+    """Conditional branches; the first matching task is executed."""
+    
+    __slots__ = ("conditions", "tasks", "dispatch")
+    
+    type: Final = "branch"
+    kind: Final = NodeKind.BRANCH
+    
+    def __init__(
+        self,
+        conditions: Tuple[ConditionFunction, ...],
+        tasks: Tuple['Task', ...],
+        dispatch: BranchDispatchFunction
+    ) -> None:
+        # Parallel tuples: conditions[i] selects tasks[i]
+        self.conditions = conditions
+        self.tasks = tasks
+        self.dispatch = dispatch
 
-class LoopNode(TypedDict):
-    type: str
-    condition: ConditionFunction
-    task: 'Task'
-    max_iterations: int
+class LoopNode:
+    """A task executed repeatedly while a condition holds."""
+    
+    __slots__ = ("condition", "task", "max_iterations")
+    
+    type: Final = "loop"
+    kind: Final = NodeKind.LOOP
+    
+    def __init__(self, condition: ConditionFunction, task: 'Task', max_iterations: int) -> None:
+        self.condition = condition
+        self.task = task
+        self.max_iterations = max_iterations
 
 # Union type for all node types
 ExecutionNode = Union[SequentialNode, ParallelNode, BranchNode, LoopNode]
-ExecutionGraph = List[ExecutionNode]
\ No newline at end of file
+# Registered flows freeze their graph to a tuple; the engine accepts any sequence
+ExecutionGraph = Sequence[ExecutionNode]
+
+# Handler coroutine for a single node, and a graph with each node's handler resolved ahead of time
+NodeHandler = Callable[[Any, InputData, 'ExecutionContext'], Awaitable[OutputData]]
+ExecutionPlan = Tuple[Tuple[NodeHandler, ExecutionNode], ...]
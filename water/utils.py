@@ -0,0 +1,34 @@
+"""Small helpers shared across the Water framework."""
+
+import os
+import random
+from datetime import datetime, timezone
+
+# Identifiers only need to be unique, not unpredictable, so a private generator
+# avoids the os.urandom call and UUID formatting of uuid4() without consuming or
+# depending on the caller's seeded module-level random state
+_id_rng = random.Random()
+
+# Forked workers would otherwise inherit the parent's state and repeat its IDs
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_id_rng.seed)
+
+def generate_id(prefix: str) -> str:
+    """
+    Generate a short random identifier.
+    
+    Args:
+        prefix: Prefix identifying the kind of object, e.g. "task"
+        
+    Returns:
+        Identifier of the form "<prefix>_<8 hex chars>"
+    """
+    return f"{prefix}_{_id_rng.getrandbits(32):08x}"
+
+def utcnow() -> datetime:
+    """
+    Get the current UTC time as a naive datetime.
+    
+    Equivalent to the deprecated datetime.utcnow().
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None)